@@ -1,46 +1,141 @@
-import json
-from pathlib import Path
+import marshal
+import os
+import sys
+from functools import lru_cache
+from typing import NamedTuple
 
-DEFAULT_MOUSE_X = None
-DEFAULT_MOUSE_Y = None
-MIN_CLICK_DELAY = None
-MAX_CLICK_DELAY = None
-KEYBOARD_ADJACENCY = None
-STEPS = None
-MAX_NON_OVERSHOOT_OFFSET = None
-MAX_OVERSHOOT_OFFSET = None
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 
 
-def _unpack_config():
-    base_dir = Path(__file__).resolve().parent
-    config_path = base_dir / "data" / "config.json"
+__all__ = [
+    "CFG",
+    "DEFAULT_MOUSE_X",
+    "DEFAULT_MOUSE_Y",
+    "MIN_CLICK_DELAY",
+    "MAX_CLICK_DELAY",
+    "KEYBOARD_ADJACENCY",
+    "STEPS",
+    "MAX_NON_OVERSHOOT_OFFSET",
+    "MAX_OVERSHOOT_OFFSET",
+]
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        return json.load(f)
 
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+_CONFIG_PATH = os.path.join(_DATA_DIR, "config.json")
+_CACHE_PATH = os.path.join(_DATA_DIR, "__pycache__", "config.json.marshal")
 
-def define_config_variables():
-    global DEFAULT_MOUSE_X
-    global DEFAULT_MOUSE_Y
-    global MIN_CLICK_DELAY
-    global MAX_CLICK_DELAY
-    global KEYBOARD_ADJACENCY
-    global STEPS
-    global MAX_NON_OVERSHOOT_OFFSET
-    global MAX_OVERSHOOT_OFFSET
 
-    data = _unpack_config()
+class Settings(NamedTuple):
+    """Immutable snapshot of the values in data/config.json."""
 
-    DEFAULT_MOUSE_Y = data["mouse"]["position"]["DEFAULT_MOUSE_Y"]
-    DEFAULT_MOUSE_X = data["mouse"]["position"]["DEFAULT_MOUSE_X"]
+    DEFAULT_MOUSE_X: int
+    DEFAULT_MOUSE_Y: int
+    MIN_CLICK_DELAY: float
+    MAX_CLICK_DELAY: float
+    KEYBOARD_ADJACENCY: dict[str, tuple[str, ...]]
+    STEPS: int
+    MAX_NON_OVERSHOOT_OFFSET: int
+    MAX_OVERSHOOT_OFFSET: int
 
-    MIN_CLICK_DELAY = data["mouse"]["input"]["MIN_CLICK_DELAY"]
-    MAX_CLICK_DELAY = data["mouse"]["input"]["MAX_CLICK_DELAY"]
 
-    KEYBOARD_ADJACENCY = data["keyboard"]["KEYBOARD_ADJACENCY"]
+def normalize_adjacency(raw: dict[str, str]) -> dict[str, tuple[str, ...]]:
+    """
+    Lower-case and intern the keys of a keyboard adjacency map and split each
+    neighbour string into a tuple, ready for `random.choice`.
 
-    STEPS = data["movement"]["STEPS"]
-    MAX_NON_OVERSHOOT_OFFSET = data["movement"]["MAX_NON_OVERSHOOT_OFFSET"]
-    MAX_OVERSHOOT_OFFSET = data["movement"]["MAX_OVERSHOOT_OFFSET"]
+    :param raw: Adjacency map as stored in config.json (e.g. {"a": "qwsz"}).
+    :type raw: dict[str, str]
+    :return: Normalized adjacency map (e.g. {"a": ("q", "w", "s", "z")}).
+    :rtype: dict[str, tuple[str, ...]]
+    """
+    # Split once here so typo sampling never has to touch the raw strings.
+    return {sys.intern(key.lower()): tuple(neighbours) for key, neighbours in raw.items()}
 
-define_config_variables() #this needs to run 
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def _unpack_config() -> Settings:
+    # Memoized; use reload() to pick up edits to config.json. cache_clear()
+    # alone would leave the values __getattr__ already published in place.
+    data = _read_config_data()
+    position = data["mouse"]["position"]
+    mouse_input = data["mouse"]["input"]
+    movement = data["movement"]
+
+    adjacency = normalize_adjacency(data["keyboard"]["KEYBOARD_ADJACENCY"])
+
+    # Numbers are coerced to the types declared on Settings here, so a
+    # hand-edited "STEPS": 20.0 cannot leak a float into range() later.
+    return Settings(
+        DEFAULT_MOUSE_X=int(position["DEFAULT_MOUSE_X"]),
+        DEFAULT_MOUSE_Y=int(position["DEFAULT_MOUSE_Y"]),
+        MIN_CLICK_DELAY=float(mouse_input["MIN_CLICK_DELAY"]),
+        MAX_CLICK_DELAY=float(mouse_input["MAX_CLICK_DELAY"]),
+        KEYBOARD_ADJACENCY=adjacency,
+        STEPS=int(movement["STEPS"]),
+        MAX_NON_OVERSHOOT_OFFSET=int(movement["MAX_NON_OVERSHOOT_OFFSET"]),
+        MAX_OVERSHOOT_OFFSET=int(movement["MAX_OVERSHOOT_OFFSET"]),
+    )
+
+
+def _read_config_data() -> dict:
+    # The sidecar holds (source mtime, source size, decoded config) and, like
+    # a .pyc, is only trusted while both still match config.json. The size
+    # catches rewrites that coarse or preserved timestamps would miss.
+    st = os.stat(_CONFIG_PATH)
+    mtime, size = st.st_mtime_ns, st.st_size
+    try:
+        with open(_CACHE_PATH, "rb") as f:
+            cached_mtime, cached_size, data = marshal.load(f)
+        if cached_mtime == mtime and cached_size == size:
+            return data
+    except (OSError, EOFError, ValueError, TypeError):
+        # Also covers sidecars in the older (mtime, data) layout.
+        pass
+
+    with open(_CONFIG_PATH, "rb") as f:
+        data = orjson.loads(f.read())
+
+    _write_config_cache(mtime, size, data)
+    return data
+
+
+def _write_config_cache(mtime, size, data):
+    # Mirror the .pyc rules: the sidecar lives in __pycache__ and is not
+    # written when bytecode writing is disabled.
+    if sys.dont_write_bytecode:
+        return
+
+    tmp_path = f"{_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump((mtime, size, data), f)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        # Read-only installs just skip the cache.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def reload() -> None:
+    # Drop the memoized snapshot and the values published by __getattr__ so
+    # the next access re-reads config.json. Names copied elsewhere with
+    # `from core.config import ...` keep their old values.
+    _unpack_config.cache_clear()
+    for name in ("CFG", *Settings._fields):
+        globals().pop(name, None)
+
+
+def __getattr__(name: str):
+    # Config values are loaded on first access rather than at import time,
+    # then stored as real module attributes so later lookups skip this hook.
+    if name == "CFG" or name in Settings._fields:
+        cfg = _unpack_config()
+        globals().update(cfg._asdict(), CFG=cfg)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,51 @@
+// Renders a red dot that follows the automated cursor, for debugging or visualization.
+// Registered as an init script, so it runs in every frame before the page's own scripts.
+(() => {
+    // Only the top frame draws the dot, and only once per document.
+    if (window !== window.top || window.__naturalCursorTracker) return;
+    window.__naturalCursorTracker = true;
+
+    const start = () => {
+        const box = document.createElement("div");
+        Object.assign(box.style, {
+            position: "fixed",
+            left: "0",
+            top: "0",
+            width: "10px",
+            height: "10px",
+            background: "red",
+            borderRadius: "8px",
+            pointerEvents: "none",
+            transform: "translate(0px, 0px) translate(-50%, -50%)",
+            zIndex: 999999,
+        });
+        document.body.appendChild(box);
+
+        let mouseX = 0, mouseY = 0, x = 0, y = 0, frame = 0;
+
+        // Ease towards the pointer, one step per frame, and stop scheduling
+        // frames once the dot has caught up so an idle page costs nothing.
+        const follow = () => {
+            x += 0.15 * (mouseX - x);
+            y += 0.15 * (mouseY - y);
+            if (Math.abs(mouseX - x) < 0.5 && Math.abs(mouseY - y) < 0.5) {
+                x = mouseX;
+                y = mouseY;
+                frame = 0;
+            } else {
+                frame = requestAnimationFrame(follow);
+            }
+            box.style.transform = `translate(${x}px, ${y}px) translate(-50%, -50%)`;
+        };
+
+        document.addEventListener("mousemove", (e) => {
+            mouseX = e.clientX;
+            mouseY = e.clientY;
+            if (!frame) frame = requestAnimationFrame(follow);
+        }, { passive: true });
+    };
+
+    // Init scripts run before <body> is parsed.
+    if (document.body) start();
+    else document.addEventListener("DOMContentLoaded", start);
+})();
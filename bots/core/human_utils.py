@@ -1,14 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
 import time
 import random
+import threading
+import weakref
 import math
 import json
-import requests
+import os
+import queue
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, expect
-from core.config import *
+from typing import TYPE_CHECKING
+from core import config
 from enum import Enum
-import filetype
+
+if TYPE_CHECKING:
+    # Type-only imports; playwright and requests are imported where they are used.
+    from collections.abc import Iterator
+
+    import requests
+    from playwright.sync_api import Browser, BrowserContext, CDPSession, ElementHandle, Locator, Page, Playwright
+    from playwright.async_api import (
+        BrowserContext as AsyncBrowserContext,
+        CDPSession as AsyncCDPSession,
+        ElementHandle as AsyncElementHandle,
+        Locator as AsyncLocator,
+        Page as AsyncPage,
+    )
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 """
 Human-like browser automation utilities built on Playwright.
 
@@ -19,6 +48,99 @@ Includes:
 - Logging utilities
 """
 
+_thread_state = threading.local()
+
+
+@lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int) -> dict:
+    """
+    Parse a JSON file, memoized on its path and modification time.
+
+    Including the mtime in the cache key means an edited file is parsed
+    again on the next call, while unchanged files are served from memory.
+
+    :param path: Path of the JSON file.
+    :type path: str
+    :param mtime_ns: Modification time of the file in nanoseconds.
+    :type mtime_ns: int
+    :return: The parsed JSON document.
+    :rtype: dict
+    """
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _get_rng() -> random.Random:
+    """
+    Get the random generator of the current thread.
+
+    Each thread lazily gets its own `random.Random`, so gestures draw from a
+    private generator that is fetched once and passed down to every helper.
+
+    :return: The thread's random generator.
+    :rtype: random.Random
+    """
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None:
+        rng = _thread_state.rng = random.Random()
+    return rng
+
+
+def _json_loads(raw: bytes):
+    """
+    Decode JSON bytes with orjson when it is installed, else the stdlib.
+
+    Both raise a `json.JSONDecodeError` (sub)class on invalid input.
+
+    :param raw: UTF-8 encoded JSON document.
+    :type raw: bytes
+    :return: The decoded document.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    """
+    Encode an object as indented JSON bytes with orjson when it is installed, else the stdlib.
+
+    Both use a 2-space indent, so the tracked custominfo.json keeps the same
+    layout whichever encoder rewrites it.
+
+    :param data: JSON-serializable object.
+    :return: UTF-8 encoded JSON document.
+    :rtype: bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+# Requests aborted by BrowserManager's resource blocking. Stylesheets are kept:
+# they drive layout, and so the bounding boxes the mouse aims at.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_URL_PARTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+)
+
+
+def _is_blocked_request(request) -> bool:
+    """
+    Tell whether a request is a heavy asset or analytics call that automation doesn't need.
+
+    :param request: Playwright Request object (sync or async).
+    :return: True if the request should be aborted.
+    :rtype: bool
+    """
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        return True
+    url = request.url
+    return any(part in url for part in _BLOCKED_URL_PARTS)
+
+
 class enums:
     class Categories(Enum):
         MOVERS = "movers"
@@ -37,7 +159,21 @@ class BrowserManager:
     - Cleaning up Playwright resources safely
     """
 
-    def __init__(self, cdp_url: str = "http://localhost:9222"):
+    # Live connections per (endpoint, thread), shared by every BrowserManager
+    # of the process (not across runs). Sync Playwright objects can't cross
+    # threads. _CONN_USERS counts the managers using each entry; only the
+    # last one to close() really disconnects.
+    _CONN_CACHE: "dict[tuple[str, int], tuple[Playwright, Browser]]" = {}
+    _CONN_USERS: "dict[tuple[str, int], int]" = {}
+    # Route handler installed by block_heavy_resources per context, with the
+    # number of callers still wanting it: managers sharing a connection share
+    # its context, and the route is only removed once the last one unblocks.
+    _resource_routes: "weakref.WeakKeyDictionary[BrowserContext, list]" = weakref.WeakKeyDictionary()
+    # Pages kept open for reuse; extra released pages are closed so the
+    # retained DOM/heap stays bounded on long runs.
+    _MAX_IDLE_PAGES = 4
+
+    def __init__(self, cdp_url: str = "http://localhost:9222", block_resources: bool = False):
         """
         Initialize the BrowserManager.
 
@@ -48,19 +184,29 @@ class BrowserManager:
                         The browser must be launched with
                         `--remote-debugging-port=9222`.
         :type cdp_url: str
+        :param block_resources: Abort image, font, media and analytics requests in the
+                                connected context (default = False). Off by default because
+                                the context is usually a real Chrome profile shared with
+                                every other tab.
+        :type block_resources: bool
         """
         self.cdp_url = cdp_url
+        self.block_resources = block_resources
         self.playwright = None
         self.browser: Browser = None
         self.context: BrowserContext = None
+        self._idle_pages: deque[Page] = deque()
+        self._conn_key: tuple[str, int] | None = None
+        # Context this manager blocked resources on, released again by close().
+        self._blocked_context: BrowserContext | None = None
 
     def connect(self) -> BrowserContext:
         """
         Connect to an existing Chromium-based browser via CDP.
 
         This method:
-        - Starts Playwright
-        - Connects to the browser over CDP
+        - Reuses a still-connected browser for the same endpoint, if any
+        - Otherwise starts Playwright and connects to the browser over CDP
         - Selects the first available browser context
         - Stores the context for future page creation
 
@@ -68,48 +214,206 @@ class BrowserManager:
         :return: The active Playwright BrowserContext.
         :rtype: BrowserContext
         """
-        Logger.log(f"Connecting to browser via CDP at {self.cdp_url}")
+        key = (self.cdp_url, threading.get_ident())
+        cached = BrowserManager._CONN_CACHE.get(key)
+        if cached is not None and cached[1].is_connected():
+            self.playwright, self.browser = cached
+            self.context = self.browser.contexts[0]
+            self._use_connection(key)
+            _log(f"Reusing CDP connection to {self.cdp_url}", 1)
+            self._block_own_context()
+            return self.context
+
+        _log(f"Connecting to browser via CDP at {self.cdp_url}")
         try:
-            self.playwright = sync_playwright().start()
+            from playwright.sync_api import sync_playwright
+
+            # A stale connection keeps its Playwright driver alive; reuse it.
+            self.playwright = cached[0] if cached is not None else sync_playwright().start()
             self.browser = self.playwright.chromium.connect_over_cdp(self.cdp_url)
             self.context = self.browser.contexts[0]
+            BrowserManager._CONN_CACHE[key] = (self.playwright, self.browser)
+            self._use_connection(key)
+            self._block_own_context()
 
-            Logger.log(
+            _log(
                 f"Successfully connected. Found {len(self.browser.contexts)} context(s)",
                 1,
             )
             return self.context
 
         except Exception as e:
-            Logger.log(f"Failed to connect to browser via CDP: {e}", 3)
-            Logger.log(
+            _log(f"Failed to connect to browser via CDP: {e}", 3)
+            _log(
                 "Make sure Chrome/Edge is running with --remote-debugging-port=9222",
                 2,
             )
             raise
 
-    def create_page(self, url: str | None = None) -> Page:
+    @staticmethod
+    def block_heavy_resources(context: BrowserContext) -> None:
+        """
+        Abort image, font, media and analytics requests of every page in the context. \n
+        Pages become interactive sooner; HTML, scripts and stylesheets still load.
+        Other requests fall back to any route the caller registered. The route is
+        installed once per context and counted: pair every call with
+        `unblock_heavy_resources()`, the last of which removes it.
+
+        :param context: Playwright BrowserContext object.
+        :type context: BrowserContext
+        """
+        entry = BrowserManager._resource_routes.get(context)
+        if entry is not None:
+            entry[1] += 1
+            return
+
+        def handle(route):
+            if _is_blocked_request(route.request):
+                route.abort()
+            else:
+                route.fallback()
+
+        context.route("**/*", handle)
+        BrowserManager._resource_routes[context] = [handle, 1]
+
+    @staticmethod
+    def unblock_heavy_resources(context: BrowserContext) -> None:
+        """
+        Undo one `block_heavy_resources()` call. The route goes away with the
+        last one; the caller's own routes are left alone.
+
+        :param context: Playwright BrowserContext object.
+        :type context: BrowserContext
+        """
+        entry = BrowserManager._resource_routes.get(context)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del BrowserManager._resource_routes[context]
+            context.unroute("**/*", entry[0])
+
+    @staticmethod
+    async def a_block_heavy_resources(context: AsyncBrowserContext) -> None:
+        """
+        Async variant of `block_heavy_resources`.
+
+        :param context: Async Playwright BrowserContext object.
+        :type context: AsyncBrowserContext
+        """
+        entry = BrowserManager._resource_routes.get(context)
+        if entry is not None:
+            entry[1] += 1
+            return
+
+        async def handle(route):
+            if _is_blocked_request(route.request):
+                await route.abort()
+            else:
+                await route.fallback()
+
+        # Registered before awaiting route(), so a concurrent call only counts.
+        BrowserManager._resource_routes[context] = [handle, 1]
+        try:
+            await context.route("**/*", handle)
+        except BaseException:
+            del BrowserManager._resource_routes[context]
+            raise
+
+    @staticmethod
+    async def a_unblock_heavy_resources(context: AsyncBrowserContext) -> None:
+        """
+        Async variant of `unblock_heavy_resources`.
+
+        :param context: Async Playwright BrowserContext object.
+        :type context: AsyncBrowserContext
+        """
+        entry = BrowserManager._resource_routes.get(context)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del BrowserManager._resource_routes[context]
+            await context.unroute("**/*", entry[0])
+
+    def _block_own_context(self) -> None:
+        """
+        Block resources on `self.context` if this manager was asked to, once per context.
+        """
+        if not self.block_resources or self._blocked_context is self.context:
+            return
+        BrowserManager.block_heavy_resources(self.context)
+        # A previously blocked context belongs to a dropped connection; its route died with it.
+        self._blocked_context = self.context
+
+    def _use_connection(self, key: tuple[str, int]) -> None:
+        """
+        Count this manager as a user of the cached connection `key` (once).
+
+        :param key: (endpoint, thread id) of the connection.
+        :type key: tuple[str, int]
+        """
+        if self._conn_key != key:
+            BrowserManager._CONN_USERS[key] = BrowserManager._CONN_USERS.get(key, 0) + 1
+            self._conn_key = key
+
+    def reattach_page(self, url_substr: str) -> Page | None:
+        """
+        Find an already open page whose URL contains `url_substr`. \n
+        Lets a rerun pick up the tab a previous run left open instead of
+        opening and loading it again.
+
+        :param url_substr: Part of the URL to look for.
+        :type url_substr: str
+        :return: The first matching page, or None if there is none.
+        :rtype: Page | None
+        """
+        for page in self.context.pages:
+            if url_substr in page.url and not page.is_closed():
+                _log(f"Reattached to {page.url}", 1)
+                return page
+        return None
+
+    def enable_cursor_tracking_context(self, context: BrowserContext | None = None) -> None:
+        """
+        Render the red cursor on every page of a context. \n
+        Call it once right after `connect()`: the tracking script is then
+        injected by Chromium into every new document, before the page's own
+        scripts run, with no per-page `MouseManager.enable_cursor_tracking` call.
+
+        :param context: Context to track (defaults to the connected context).
+        :type context: BrowserContext | None
+        """
+        MouseManager.enable_context_cursor_tracking(context or self.context)
+
+    def create_page(self, url: str | None = None, wait_until: str = "domcontentloaded") -> Page:
         """
         Create a new page within the active browser context.
 
+        Pages previously handed back through `release_page()` are reused
+        before a new one is opened.
         Optionally navigates to a URL immediately after page creation.
         Navigation errors are logged but do not crash execution.
 
         :param url: Optional URL to navigate to after creating the page.
         :type url: str | None
+        :param wait_until: Navigation event to wait for (default = "domcontentloaded").
+                           Use "commit" to return as soon as the response starts and let
+                           locator auto-waiting cover the rest; "load" waits for every subresource.
+        :type wait_until: str
         :return: The newly created Playwright Page object.
         :rtype: Page
         """
-        page = self.context.new_page()
+        page = self._take_idle_page() or self.context.new_page()
 
         if url:
-            Logger.log(f"Navigating to {url}")
+            _log(f"Navigating to {url}")
             try:
-                page.goto(url, timeout=30_000)
-                Logger.log(f"Successfully navigated to {url}", 1)
+                page.goto(url, wait_until=wait_until, timeout=15_000)
+                _log(f"Successfully navigated to {url}", 1)
             except Exception as e:
-                Logger.log(f"Failed to navigate to {url}: {e}", 3)
-                Logger.log(f"Current URL: {page.url}", 2)
+                _log(f"Failed to navigate to {url}: {e}", 3)
+                _log(f"Current URL: {page.url}", 2)
 
         return page
 
@@ -127,10 +431,11 @@ class BrowserManager:
         - Navigation dead-ends
         - Resetting state cleanly
 
-        The method is fault-tolerant and will ignore failures when
-        closing the old page.
+        The old page is never reused: it may be hung, and nothing run inside
+        it is guaranteed to return. Failures while closing it are ignored.
+        Use `release_page()` to hand back a healthy page for reuse.
 
-        :param old_page: Existing Page object to close before restarting.
+        :param old_page: Existing Page object to close; a new page replaces it.
         :type old_page: Page | None
         :param reason: Optional reason for restart (used for logging).
         :type reason: str
@@ -139,7 +444,7 @@ class BrowserManager:
         :return: The newly created Playwright Page object.
         :rtype: Page
         """
-        Logger.log(f"RESTARTING PAGE ({reason})", 2)
+        _log(f"RESTARTING PAGE ({reason})", 2)
 
         try:
             if old_page:
@@ -154,17 +459,158 @@ class BrowserManager:
 
         return page
 
+    def reset_page(
+        self,
+        page: Page,
+        url: str | None = None,
+        clear_cookies: bool = False,
+        clear_storage: bool = False,
+    ) -> Page:
+        """
+        Clear a page's state so it can be reused instead of closed.
+
+        The page is parked on about:blank before optionally navigating to `url`.
+
+        :param page: Page object to reset.
+        :type page: Page
+        :param url: Optional URL to navigate to after the reset.
+        :type url: str | None
+        :param clear_cookies: Also clear the cookies of the whole context (default = False).
+                              Off by default because the context is usually a real
+                              Chrome profile shared with every other tab.
+        :type clear_cookies: bool
+        :param clear_storage: Also clear localStorage and sessionStorage of the page's
+                              current origin (default = False). Off by default for the
+                              same reason: localStorage is shared with the user's other
+                              tabs on that site.
+        :type clear_storage: bool
+        :return: The same Page object, reset.
+        :rtype: Page
+        """
+        if clear_storage:
+            try:
+                page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+            except Exception:
+                # about:blank and some sandboxed origins have no storage to clear.
+                pass
+
+        if clear_cookies:
+            self.context.clear_cookies()
+
+        page.goto("about:blank")
+
+        if url:
+            page.goto(url, wait_until="domcontentloaded")
+
+        return page
+
+    def release_page(self, page: Page) -> None:
+        """
+        Hand a page back so a later `create_page()` can reuse it. \n
+        The page is closed instead when the pool already holds
+        `_MAX_IDLE_PAGES` pages or it can't be reset.
+
+        :param page: Page object that is no longer needed.
+        :type page: Page
+        """
+        if page.is_closed():
+            return
+
+        if len(self._idle_pages) < self._MAX_IDLE_PAGES:
+            try:
+                self.reset_page(page)
+                self._idle_pages.append(page)
+                return
+            except Exception:
+                pass
+
+        try:
+            page.close(run_before_unload=False)
+        except Exception:
+            pass
+
+    @contextmanager
+    def page(self, url: str | None = None, wait_until: str = "domcontentloaded") -> Iterator[Page]:
+        """
+        Borrow a page for the duration of a `with` block.
+
+        The page comes from `create_page()` and is handed back through
+        `release_page()` on exit, even if the block raises.
+
+        Example:
+            with browser.page("https://example.com") as page:
+                ...
+
+        :param url: Optional URL to navigate to.
+        :type url: str | None
+        :param wait_until: Navigation event to wait for (default = "domcontentloaded").
+        :type wait_until: str
+        :return: Context manager yielding the Page object.
+        :rtype: Iterator[Page]
+        """
+        page = self.create_page(url, wait_until=wait_until)
+        try:
+            yield page
+        finally:
+            self.release_page(page)
+
+    def _take_idle_page(self) -> Page | None:
+        """
+        Pop a still-open page from the idle list.
+
+        :return: A reusable Page, or None if there is none.
+        :rtype: Page | None
+        """
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
+        return None
+
     def close(self) -> None:
         """
         Gracefully shut down the browser and Playwright instance.
 
         This method:
+        - Closes the pages pooled by `release_page()`
+        - Releases its share of the resource blocking, if it asked for any
         - Closes the browser connection if active
         - Stops Playwright safely
         - Silently ignores cleanup errors
 
+        The connection is shared with other managers of the same endpoint;
+        while any of them still uses it, this one only lets go of it.
+
         Intended to be called during shutdown or fatal error handling.
         """
+        # Over CDP, browser.close() only disconnects; pooled pages would stay
+        # open as about:blank tabs in the user's browser.
+        while self._idle_pages:
+            try:
+                self._idle_pages.popleft().close(run_before_unload=False)
+            except Exception:
+                pass
+
+        # Other managers may share the context: only the last one to release
+        # the blocking route removes it.
+        if self._blocked_context is not None:
+            try:
+                BrowserManager.unblock_heavy_resources(self._blocked_context)
+            except Exception:
+                pass
+            self._blocked_context = None
+
+        key = self._conn_key
+        self._conn_key = None
+        if key is not None:
+            users = BrowserManager._CONN_USERS.get(key, 1) - 1
+            if users > 0:
+                BrowserManager._CONN_USERS[key] = users
+                self.playwright = self.browser = self.context = None
+                return
+            BrowserManager._CONN_USERS.pop(key, None)
+            BrowserManager._CONN_CACHE.pop(key, None)
+
         try:
             if self.browser:
                 self.browser.close()
@@ -190,7 +636,7 @@ class Config:
     MAX_CLICK_DELAY: float
 
     # Keyboard
-    KEYBOARD_ADJACENCY: dict[str, str]
+    KEYBOARD_ADJACENCY: dict[str, tuple[str, ...]]
 
     # Movement
     STEPS: int
@@ -202,8 +648,7 @@ class Config:
         if cls._loaded:
             return
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(str(path), os.stat(path).st_mtime_ns)
 
         # ---- Mouse ----
         mouse = data["mouse"]
@@ -213,7 +658,7 @@ class Config:
         cls.MAX_CLICK_DELAY = mouse["input"]["MAX_CLICK_DELAY"]
 
         # ---- Keyboard ----
-        cls.KEYBOARD_ADJACENCY = data["keyboard"]["KEYBOARD_ADJACENCY"]
+        cls.KEYBOARD_ADJACENCY = config.normalize_adjacency(data["keyboard"]["KEYBOARD_ADJACENCY"])
 
         # ---- Movement ----
         movement = data["movement"]
@@ -244,9 +689,7 @@ class ConfigManager:
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
         try:
-            with config_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data
+            return _load_json(str(config_path), config_path.stat().st_mtime_ns)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
         
@@ -281,7 +724,7 @@ class ConfigManager:
         MIN_CLICK_DELAY = mouse_input["MIN_CLICK_DELAY"]
 
         keyboard = data["keyboard"]
-        KEYBOARD_ADJACENCY = keyboard["KEYBOARD_ADJACENCY"]
+        KEYBOARD_ADJACENCY = config.normalize_adjacency(keyboard["KEYBOARD_ADJACENCY"])
 
         movement = data["movement"]
         STEPS = movement["STEPS"]
@@ -290,6 +733,127 @@ class ConfigManager:
         return DEFAULT_MOUSE_Y, DEFAULT_MOUSE_X, MAX_CLICK_DELAY, MIN_CLICK_DELAY, KEYBOARD_ADJACENCY, STEPS, MAX_NON_OVERSHOOT_OFFSET, MAX_OVERSHOOT_OFFSET
     
 
+_LOG_COLORS = {
+    0: "\033[97m",  # system (white)
+    1: "\033[92m",  # success (green)
+    2: "\033[93m",  # warning (yellow)
+    3: "\033[91m",  # error (red)
+}
+
+_LOG_LEVEL_NAMES = {
+    0: "SYSTEM",
+    1: "SUCCESS",
+    2: "WARNING",
+    3: "ERROR",
+}
+
+_LOG_RESET = "\033[0m"
+
+# Records are queued by _log and written by a daemon thread, so logging never
+# blocks the caller (or the asyncio loop) on a slow terminal.
+_LOG_QUEUE: "queue.SimpleQueue[str | threading.Event]" = queue.SimpleQueue()
+_LOG_BATCH_SIZE = 64
+_LOG_BATCH_WINDOW = 0.02
+_log_thread: threading.Thread | None = None
+_log_thread_lock = threading.Lock()
+
+
+def _drain_log_queue() -> None:
+    """
+    Write queued log records to stdout, coalescing up to _LOG_BATCH_SIZE
+    records or _LOG_BATCH_WINDOW seconds into one write. \n
+    Runs forever on the logging thread. An Event in the queue is set once
+    every record queued before it has been written.
+    """
+    get = _LOG_QUEUE.get
+    while True:
+        batch = [get()]
+        deadline = time.monotonic() + _LOG_BATCH_WINDOW
+        while len(batch) < _LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        lines = [record for record in batch if isinstance(record, str)]
+        if lines:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+        for record in batch:
+            if isinstance(record, threading.Event):
+                record.set()
+
+
+def _flush_log(timeout: float | None = 1.0) -> None:
+    """
+    Wait until every queued log record has been written. \n
+    Registered with atexit, without a timeout, so messages logged right before
+    exit are not lost however slow the terminal is.
+    
+    :param timeout: Maximum time to wait in seconds, None to wait until done (default = 1.0).
+    :type timeout: float | None
+    """
+    if _log_thread is None:
+        return
+    done = threading.Event()
+    _LOG_QUEUE.put(done)
+    done.wait(timeout)
+
+
+def _start_log_thread() -> None:
+    """
+    Start the logging thread on first use.
+    """
+    global _log_thread
+    with _log_thread_lock:
+        if _log_thread is None:
+            thread = threading.Thread(target=_drain_log_queue, name="human_utils-log", daemon=True)
+            thread.start()
+            _log_thread = thread
+
+
+atexit.register(_flush_log, None)
+
+
+def _log(message: str, level: int = 0) -> None:
+    """
+    Logs events in the CLI using color coded severity levels. \n
+    Module-level so hot paths can call it without a class attribute lookup;
+    `Logger.log` is the public alias. System and success records are queued
+    and written by a background thread, so they never wait on stdout;
+    warnings and errors are written synchronously.
+    
+    :param message: String to log.
+    :type message: str
+    :param level: Severity of the event:\n
+        0. System (white)\n
+        1. Success (green)\n
+        2. Warning (yellow)\n
+        3. Error (red)
+    :type level: int
+    """
+    color = _LOG_COLORS.get(level, _LOG_COLORS[0])
+    level_name = _LOG_LEVEL_NAMES.get(level, _LOG_LEVEL_NAMES[0])
+
+    line = f"{color}[{time.strftime('%H:%M:%S')}] [{level_name}] {message}{_LOG_RESET}\n"
+
+    if level >= 2:
+        # Warnings and errors are written right away (after anything still
+        # queued) so they show up before e.g. the traceback of a re-raise.
+        _flush_log()
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        return
+
+    if _log_thread is None:
+        _start_log_thread()
+
+    _LOG_QUEUE.put_nowait(line)
+
+
 class Logger:
     """
     Handles Logger.logging to CLI with timestamps and levels.
@@ -304,43 +868,45 @@ class Logger:
         :return: Timestamp in Hour:Minute:Second format.
         :rtype: str
         """
-        return datetime.now().strftime("%H:%M:%S")
-    
+        return time.strftime("%H:%M:%S")
     
-    @staticmethod
-    def log(message: str, level: int = 0) -> None:
-        """
-        Logger.logs events in the CLI using color coded severity levels 
-        
-        :param message: String to Logger.log.
-        :type message: str
-        :param level: Severity of the event:\n
-            0. System (white)\n
-            1. Success (green)\n
-            2. Warning (yellow)\n
-            3. Error (red)
-        :type level: int
-        """
+    log = staticmethod(_log)
 
-        COLORS = {
-            0: "\033[97m",  # system (white)
-            1: "\033[92m",  # success (green)
-            2: "\033[93m",  # warning (yellow)
-            3: "\033[91m",  # error (red)
-        }
 
-        LEVEL_NAMES = {
-            0: "SYSTEM",
-            1: "SUCCESS",
-            2: "WARNING",
-            3: "ERROR",
-        }
+def _human_delay(min_delay: float = 1.0, max_delay: float = 3.0, reason: str = "") -> None:
+    """
+    Pauses for a random amount of time and logs the reason why. \n
+    `DelayManager.human_delay` is the public alias.
+    
+    :param min_delay: Minimum delay constraint.
+    :type min_delay: float
+    :param max_delay: Maximum delay constraint.
+    :type max_delay: float
+    :param reason: Reason for pause. Logs with 'system' level severity.
+    :type reason: str
+    """
+    delay = random.uniform(min_delay, max_delay)
+    if reason:
+        _log(f"Sleeping {delay:.2f}s {reason}",0)
+    time.sleep(delay)
 
-        RESET = "\033[0m"
-        color = COLORS.get(level, COLORS[0])
-        level_name = LEVEL_NAMES.get(level, LEVEL_NAMES[0])
 
-        print(f"{color}[{Logger._timestamp()}] [{level_name}] {message}{RESET}", flush=True)
+async def _a_human_delay(min_delay: float = 1.0, max_delay: float = 3.0, reason: str = "") -> None:
+    """
+    Async variant of `_human_delay`; awaits instead of blocking the event loop. \n
+    `DelayManager.a_human_delay` is the public alias.
+    
+    :param min_delay: Minimum delay constraint.
+    :type min_delay: float
+    :param max_delay: Maximum delay constraint.
+    :type max_delay: float
+    :param reason: Reason for pause. Logs with 'system' level severity.
+    :type reason: str
+    """
+    delay = random.uniform(min_delay, max_delay)
+    if reason:
+        _log(f"Sleeping {delay:.2f}s {reason}",0)
+    await asyncio.sleep(delay)
 
 
 class DelayManager:
@@ -364,48 +930,79 @@ class DelayManager:
         return random.uniform(min,max)
     
     
-    @staticmethod
-    def human_delay(min_delay: float = 1.0, max_delay: float = 3.0, reason: str = "") -> None:
-        """
-        Pauses for a random amount of time and Logger.log the reason why. Used for readability. 
-        
-        :param min_delay: Minimum delay constraint.
-        :type min_delay: float
-        :param max_delay: Maximum delay constraint.
-        :type max_delay: float
-        :param reason: Reason for pause. Logger.logs with 'system' level severity.
-        :type reason: str
-        """
-
-        delay = random.uniform(min_delay, max_delay)
-        if reason:
-            Logger.log(f"Sleeping {delay:.2f}s {reason}",0)
-        time.sleep(delay)
+    human_delay = staticmethod(_human_delay)
+    a_human_delay = staticmethod(_a_human_delay)
 
     
     @staticmethod
-    def idle_delay(page:Page, element:object, min_times:int = 1, max_times:int = 5) -> None:
+    def idle_delay(page:Page, element: Locator | ElementHandle, min_times:int = 1, max_times:int = 5, min_pause: float = 0.2, max_pause: float = 1.0) -> None:
         """
-        Simulates human delay by moving mouse randomly around specified element.
+        Simulates human delay by moving mouse randomly around specified element,
+        resting for a moment between movements.
         
         :param page: Page object from your Playwright page
         :type page: Page
-        :param element: Playwright locator object.
-        :type element: object
+        :param element: Playwright Locator or ElementHandle.
+        :type element: Locator | ElementHandle
         :param min_times: Minimum times to move mouse constraint (default = 1).
         :type min_times: int
         :param max_times: Maximum times to move mouse constraint (default = 5).
         :type max_times: int
+        :param min_pause: Minimum pause between two movements in seconds (default = 0.2).
+        :type min_pause: float
+        :param max_pause: Maximum pause between two movements in seconds (default = 1.0).
+        :type max_pause: float
         """
         for i in range(random.randint(min_times,max_times)):
+            if i:
+                page.wait_for_timeout(random.uniform(min_pause, max_pause) * 1000)
             MouseManager.human_movement(page, element)
 
+    @staticmethod
+    async def a_idle_delay(
+        page: AsyncPage,
+        element: AsyncLocator | AsyncElementHandle,
+        min_times: int = 1,
+        max_times: int = 5,
+        min_pause: float = 0.2,
+        max_pause: float = 1.0,
+    ) -> None:
+        """
+        Async variant of `idle_delay`. \n
+        The pauses are awaited, so other tasks (e.g. loading the next page) run meanwhile.
+        
+        :param page: Page object from your async Playwright page
+        :type page: AsyncPage
+        :param element: Async Playwright Locator or ElementHandle.
+        :type element: AsyncLocator | AsyncElementHandle
+        :param min_times: Minimum times to move mouse constraint (default = 1).
+        :type min_times: int
+        :param max_times: Maximum times to move mouse constraint (default = 5).
+        :type max_times: int
+        :param min_pause: Minimum pause between two movements in seconds (default = 0.2).
+        :type min_pause: float
+        :param max_pause: Maximum pause between two movements in seconds (default = 1.0).
+        :type max_pause: float
+        """
+        for i in range(random.randint(min_times,max_times)):
+            if i:
+                await asyncio.sleep(random.uniform(min_pause, max_pause))
+            await MouseManager.a_human_movement(page, element)
+
 class MouseManager:
     """
     Handles human-like mouse movement and mouse tracking.
     """
+    # One cursor position shared by every gesture: run gestures one at a time,
+    # not concurrently (e.g. under asyncio.gather), or their curves interleave.
     _last_x: int | None = None
     _last_y: int | None = None
+    # custominfo.json sits next to this module, so its folder always exists.
+    _JSON_PATH: Path = Path(__file__).resolve().parent / "custominfo.json"
+    _viewport_cache: "weakref.WeakKeyDictionary[Page, dict[str, int]]" = weakref.WeakKeyDictionary()
+    # False marks pages whose browser has no CDP (Firefox, WebKit).
+    _cdp_sessions: "weakref.WeakKeyDictionary[Page, CDPSession | bool]" = weakref.WeakKeyDictionary()
+    _CURSOR_TRACKER_PATH: Path = Path(__file__).resolve().parent / "data" / "cursor_tracker.js"
     
     @staticmethod
     def enable_cursor_tracking(page: Page) -> None:
@@ -415,39 +1012,89 @@ class MouseManager:
         :param page: Playwright Page object (your current page).
         :type page: Page
         '''
-        page.evaluate('''const box=document.createElement("div");Object.assign(box.style,{position:"fixed",width:"10px",height:"10px",background:"red",borderRadius:"8px",pointerEvents:"none",transform:"translate(-50%, -50%)",zIndex:999999}),document.body.appendChild(box);let mouseX=0,mouseY=0,x=0,y=0;document.addEventListener("mousemove",(e=>{mouseX=e.clientX,mouseY=e.clientY})),function e(){x+=.15*(mouseX-x),y+=.15*(mouseY-y),box.style.left=x+"px",box.style.top=y+"px",requestAnimationFrame(e)}();''')
+        page.evaluate(MouseManager._cursor_tracker_js())
+
+    @staticmethod
+    async def a_enable_cursor_tracking(page: AsyncPage) -> None:
+        '''
+        Async variant of `enable_cursor_tracking`.
+        
+        :param page: Async Playwright Page object (your current page).
+        :type page: AsyncPage
+        '''
+        await page.evaluate(MouseManager._cursor_tracker_js())
+
+    @staticmethod
+    def enable_context_cursor_tracking(context: BrowserContext) -> None:
+        '''
+        Render the red cursor on every page opened in the context from now on. \n
+        The script is registered once as an init script, so new pages and
+        navigations get it without a per-page `enable_cursor_tracking` call.
+        
+        :param context: Playwright BrowserContext object.
+        :type context: BrowserContext
+        '''
+        context.add_init_script(path=MouseManager._CURSOR_TRACKER_PATH)
+
+    @staticmethod
+    async def a_enable_context_cursor_tracking(context: AsyncBrowserContext) -> None:
+        '''
+        Async variant of `enable_context_cursor_tracking`.
+        
+        :param context: Async Playwright BrowserContext object.
+        :type context: AsyncBrowserContext
+        '''
+        await context.add_init_script(path=MouseManager._CURSOR_TRACKER_PATH)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _cursor_tracker_js() -> str:
+        '''
+        Read data/cursor_tracker.js once for per-page injection.
+        
+        :return: Source of the cursor tracking script.
+        :rtype: str
+        '''
+        return MouseManager._CURSOR_TRACKER_PATH.read_text(encoding="utf-8")
 
     @staticmethod
     def _get_mouse_last_location() -> tuple:
         """
         Retrives last mouse location. \n
         By default, the script only tracks automated mouse movement.
+        The location is read from custominfo.json once and kept in memory afterwards.
         
         :return: (x,y) value of mouse location.
         :rtype: tuple
         """
-        
-        BASE_DIR = Path(__file__).parent.parent
-        json_file = BASE_DIR / "core" / "custominfo.json"
+        if MouseManager._last_x is None or MouseManager._last_y is None:
+            MouseManager._last_x, MouseManager._last_y = MouseManager._load_mouse_location()
+        return MouseManager._last_x, MouseManager._last_y
 
-        json_file.parent.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _load_mouse_location() -> tuple:
+        """
+        Read the persisted mouse location from custominfo.json, populating defaults if needed.
+        
+        :return: (x,y) value of mouse location.
+        :rtype: tuple
+        """
+        json_file = MouseManager._JSON_PATH
 
         if json_file.exists():
-            with open(json_file, "r") as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = {}
-                    Logger.log("custominfo.json is corrupted. Resetting data.", 2)
+            try:
+                data = _json_loads(json_file.read_bytes())
+            except json.JSONDecodeError:
+                data = {}
+                _log("custominfo.json is corrupted. Resetting data.", 2)
         else:
             data = {}
-            Logger.log("custominfo.json doesn't exist. Creating it in the 'core' directory.", 3)
+            _log("custominfo.json doesn't exist. Creating it in the 'core' directory.", 3)
 
         if "mouse_location" not in data:
-            data["mouse_location"] = {"x": DEFAULT_MOUSE_X, "y": DEFAULT_MOUSE_Y}
-            with open(json_file, "w") as f:
-                json.dump(data, f, indent=4)
-                Logger.log("custominfo.json empty. Populated with default mouse data.", 2)
+            data["mouse_location"] = {"x": config.DEFAULT_MOUSE_X, "y": config.DEFAULT_MOUSE_Y}
+            json_file.write_bytes(_json_dumps(data))
+            _log("custominfo.json empty. Populated with default mouse data.", 2)
                 
         return data["mouse_location"]["x"], data["mouse_location"]["y"]
 
@@ -455,41 +1102,48 @@ class MouseManager:
     @staticmethod
     def _update_mouse_last_location(x: int, y: int) -> None:
         """
-        Update the mouse location.
+        Update the in-memory mouse location. \n
+        Call _flush_mouse_location to persist it to custominfo.json.
         
         :param x: x-value of mouse location
         :type x: int
         :param y: y-value of mouse location
         :type y: int
         """
-        BASE_DIR = Path(__file__).parent.parent
-        json_file = BASE_DIR / "core" / "custominfo.json"
+        MouseManager._last_x = x
+        MouseManager._last_y = y
+
+    @staticmethod
+    def _flush_mouse_location() -> None:
+        """
+        Persist the in-memory mouse location to custominfo.json. \n
+        Called once per gesture and at interpreter exit.
+        """
+        if MouseManager._last_x is None or MouseManager._last_y is None:
+            return
 
-        # Ensure the core folder exists
-        json_file.parent.mkdir(parents=True, exist_ok=True)
+        json_file = MouseManager._JSON_PATH
 
         # Load existing data or create empty dict
         if json_file.exists():
-            with open(json_file, "r") as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = {}
-                    Logger.log("custominfo.json is corrupted. Resetting data.", 2)
+            try:
+                data = _json_loads(json_file.read_bytes())
+            except json.JSONDecodeError:
+                data = {}
+                _log("custominfo.json is corrupted. Resetting data.", 2)
         else:
             data = {}
-            Logger.log("custominfo.json doesn't exist. Creating it in the 'core' directory.", 3)
+            _log("custominfo.json doesn't exist. Creating it in the 'core' directory.", 3)
 
         # Update mouse location
-        data["mouse_location"] = {"x": x, "y": y}
+        data["mouse_location"] = {"x": MouseManager._last_x, "y": MouseManager._last_y}
 
         # Save updated JSON
-        with open(json_file, "w") as f:
-            json.dump(data, f, indent=4)
+        json_file.write_bytes(_json_dumps(data))
         
     
     @staticmethod
-    def _move_mouse_curved(page: Page, target_x : float, target_y : float, steps=STEPS) -> None:
+    def _move_mouse_curved(page: Page, target_x : float, target_y : float, steps: int | None = None, rng: random.Random | None = None) -> None:
         """
         Move the mouse along a randomized, imperfect curved path. 
         
@@ -499,14 +1153,137 @@ class MouseManager:
         :type target_x: float
         :param target_y: Target y-value
         :type target_y: float
-        :param steps: Controls smoothness of movement. Also impacts mouse speed.
+        :param steps: Controls smoothness of movement. Also impacts mouse speed (default = STEPS from config.json).
+        :type steps: int | None
+        :param rng: Random generator of the current gesture (defaults to the thread's generator).
+        :type rng: random.Random | None
         """
+        rng = rng or _get_rng()
         start_x, start_y = MouseManager._get_mouse_last_location()
-        viewport = MouseManager._get_viewport_size(page)
+        points = MouseManager._curve_points(
+            start_x, start_y, target_x, target_y, MouseManager._get_viewport_size(page), steps, rng
+        )
+
+        # Bind the per-step callables once; this loop runs for every point.
+        session = MouseManager._get_cdp_session(page)
+        update_location = MouseManager._update_mouse_last_location
+
+        if session is None:
+            # Not Chromium: go through Playwright's mouse instead.
+            move = page.mouse.move
+            for x, y in points:
+                move(x, y)
+                update_location(x, y)
+            return
+
+        send = session.send
+        for x, y in points:
+            send("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y})
+            update_location(x, y)
+
+    @staticmethod
+    async def _a_move_mouse_curved(page: AsyncPage, target_x : float, target_y : float, steps: int | None = None, rng: random.Random | None = None) -> None:
+        """
+        Async variant of `_move_mouse_curved`. 
+        
+        :param page: Async Playwright Page object (your current page).
+        :type page: AsyncPage
+        :param target_x: Target x-value
+        :type target_x: float
+        :param target_y: Target y-value
+        :type target_y: float
+        :param steps: Controls smoothness of movement. Also impacts mouse speed (default = STEPS from config.json).
+        :type steps: int | None
+        :param rng: Random generator of the current gesture (defaults to the thread's generator).
+        :type rng: random.Random | None
+        """
+        rng = rng or _get_rng()
+        start_x, start_y = MouseManager._get_mouse_last_location()
+        points = MouseManager._curve_points(
+            start_x, start_y, target_x, target_y, await MouseManager._a_get_viewport_size(page), steps, rng
+        )
+
+        session = await MouseManager._a_get_cdp_session(page)
+        update_location = MouseManager._update_mouse_last_location
+
+        if session is None:
+            # Not Chromium: go through Playwright's mouse instead.
+            move = page.mouse.move
+            for x, y in points:
+                await move(x, y)
+                update_location(x, y)
+            return
+
+        send = session.send
+        for x, y in points:
+            await send("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y})
+            update_location(x, y)
+
+    @staticmethod
+    async def _a_click_at(page: AsyncPage, x: float, y: float) -> None:
+        """
+        Press and release the left button at (x, y) in one CDP burst. \n
+        Both events are sent before either reply is awaited; the session
+        delivers them in order, so the click costs a single round-trip.
+        Moves stay one-by-one in `_a_move_mouse_curved`, which paces the curve.
+        Falls back to `page.mouse.click` on browsers without CDP.
+        
+        :param page: Async Playwright Page object (your current page).
+        :type page: AsyncPage
+        :param x: x-value of the click
+        :type x: float
+        :param y: y-value of the click
+        :type y: float
+        """
+        session = await MouseManager._a_get_cdp_session(page)
+        if session is None:
+            await page.mouse.click(x, y)
+            return
+
+        send = session.send
+        await asyncio.gather(
+            send("Input.dispatchMouseEvent", {"type": "mousePressed", "x": x, "y": y, "button": "left", "clickCount": 1}),
+            send("Input.dispatchMouseEvent", {"type": "mouseReleased", "x": x, "y": y, "button": "left", "clickCount": 1}),
+        )
+
+    @staticmethod
+    def _curve_points(
+        start_x: float,
+        start_y: float,
+        target_x: float,
+        target_y: float,
+        viewport: dict[str, int],
+        steps: int | None,
+        rng: random.Random,
+    ) -> list[tuple[float, float]]:
+        """
+        Compute the points of a randomized, imperfect curved path. 
+        
+        :param start_x: Start x-value
+        :type start_x: float
+        :param start_y: Start y-value
+        :type start_y: float
+        :param target_x: Target x-value
+        :type target_x: float
+        :param target_y: Target y-value
+        :type target_y: float
+        :param viewport: {"width":width, "height":height} of the page; points are clamped to it.
+        :type viewport: dict[str, int]
+        :param steps: Controls smoothness of movement. Also impacts mouse speed.
+                      None uses STEPS from config.json, read at call time so
+                      importing this module doesn't load the config.
+        :type steps: int | None
+        :param rng: Random generator of the current gesture.
+        :type rng: random.Random
+        :return: (x,y) values of the path, ending on the target.
+        :rtype: list[tuple[float, float]]
+        """
+        if steps is None:
+            steps = config.STEPS
 
         # Randomize offset of control point
-        ctrl_x = start_x + (target_x - start_x) * random.uniform(0.3, 0.7)
-        ctrl_y = start_y + (target_y - start_y) * random.uniform(0.2, 0.8)
+        ctrl_x = start_x + (target_x - start_x) * rng.uniform(0.3, 0.7)
+        ctrl_y = start_y + (target_y - start_y) * rng.uniform(0.2, 0.8)
 
         # Calculate Euclidean distance between start and target
         dx = target_x - start_x
@@ -517,74 +1294,149 @@ class MouseManager:
         # You can tweak 50 here to control sensitivity
         steps = max(2, int(steps * (1 - math.exp(-distance / 75))))
 
-        for i in range(steps + 1):
-            t = i / steps
+        width = viewport["width"]
+        height = viewport["height"]
+        points = []
+
+        for w_start, w_ctrl, w_target in MouseManager._bezier_weights(steps):
             # Quadratic Bezier formula
-            x = (1 - t)**2 * start_x + 2 * (1 - t) * t * ctrl_x + t**2 * target_x
-            y = (1 - t)**2 * start_y + 2 * (1 - t) * t * ctrl_y + t**2 * target_y
+            x = w_start * start_x + w_ctrl * ctrl_x + w_target * target_x
+            y = w_start * start_y + w_ctrl * ctrl_y + w_target * target_y
 
             # Clamp to viewport
-            x = min(max(0, x), viewport["width"])
-            y = min(max(0, y), viewport["height"])
+            points.append((min(max(0, x), width), min(max(0, y), height)))
+
+        return points
 
-            page.mouse.move(x, y)
-            MouseManager._update_mouse_last_location(x, y)
-    
-    
     @staticmethod
-    def _safe_cord_randomize(page: Page, x: float, y: float, min_offset: float=-50, max_offset: float=50) -> tuple:
+    def _get_cdp_session(page: Page) -> CDPSession | None:
         """
-        Offset coordinates randomly without going off the visible page.
+        Get a CDP session attached to the page, creating it on first use. \n
+        Mouse moves are sent as raw Input.dispatchMouseEvent commands through
+        this session, skipping Playwright's per-call mouse bookkeeping.
+        CDP only exists on Chromium; for Firefox and WebKit pages this returns
+        None (remembered per page) and callers use `page.mouse` instead.
+        On Chromium, errors creating the session are raised, not hidden.
         
-        :param page: Playwright Page object (you current page).
+        :param page: Playwright Page object (your current page).
         :type page: Page
-        :param x: Starting x-value
-        :type x: float
-        :param y: Starting y-value
-        :type y: float
-        :param min_offset: Minimum offset (fallback value -50).
-        :type min_offset: float
-        :param max_offset: Maximum offset (fallback value 50).
-        :type max_offset: float
-        :return: (x,y) values of new coordinates.
-        :rtype: tuple
+        :return: CDP session bound to the page, or None if the browser has no CDP.
+        :rtype: CDPSession | None
+        """
+        session = MouseManager._cdp_sessions.get(page)
+        if session is None:
+            browser_name = MouseManager._browser_name(page)
+            if browser_name is None:
+                # Persistent contexts have no Browser to ask; try, and retry
+                # on the next gesture rather than remembering a failure.
+                try:
+                    session = page.context.new_cdp_session(page)
+                except Exception:
+                    return None
+            elif browser_name == "chromium":
+                session = page.context.new_cdp_session(page)
+            else:
+                session = False
+            MouseManager._cdp_sessions[page] = session
+        return session or None
+
+    @staticmethod
+    async def _a_get_cdp_session(page: AsyncPage) -> AsyncCDPSession | None:
         """
-        viewport = MouseManager._get_viewport_size(page)
-        new_x = x + random.uniform(min_offset, max_offset)
-        new_y = y + random.uniform(min_offset, max_offset)
-        new_x = min(max(0, new_x), viewport["width"])
-        new_y = min(max(0, new_y), viewport["height"])
-        return new_x, new_y
+        Async variant of `_get_cdp_session`.
+        
+        :param page: Async Playwright Page object (your current page).
+        :type page: AsyncPage
+        :return: CDP session bound to the page, or None if the browser has no CDP.
+        :rtype: AsyncCDPSession | None
+        """
+        session = MouseManager._cdp_sessions.get(page)
+        if session is None:
+            browser_name = MouseManager._browser_name(page)
+            if browser_name is None:
+                try:
+                    session = await page.context.new_cdp_session(page)
+                except Exception:
+                    return None
+            elif browser_name == "chromium":
+                session = await page.context.new_cdp_session(page)
+            else:
+                session = False
+            MouseManager._cdp_sessions[page] = session
+        return session or None
+
+    @staticmethod
+    def _browser_name(page: Page | AsyncPage) -> str | None:
+        """
+        Get the engine name ("chromium", "firefox", "webkit") of the page's browser.
+        
+        :param page: Playwright Page object (sync or async).
+        :type page: Page | AsyncPage
+        :return: The engine name, or None when the context has no Browser (persistent contexts).
+        :rtype: str | None
+        """
+        browser = page.context.browser
+        if browser is None:
+            return None
+        return browser.browser_type.name
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _bezier_weights(steps: int) -> tuple[tuple[float, float, float], ...]:
+        """
+        Precompute the quadratic Bezier weights for each step of a curve.
+        
+        :param steps: Number of segments in the curve.
+        :type steps: int
+        :return: ((1-t)^2, 2(1-t)t, t^2) for t = 0, 1/steps, ..., 1.
+        :rtype: tuple[tuple[float, float, float], ...]
+        """
+        weights = []
+        for i in range(steps + 1):
+            t = i / steps
+            u = 1 - t
+            weights.append((u * u, 2 * u * t, t * t))
+        return tuple(weights)
     
     
     @staticmethod
-    def _random_point_in_box(left: float, right: float, top: float, bottom: float) -> tuple:
+    def _sample_points(viewport: dict[str, int], boxes: list[tuple[float, float, float, float]], rng: random.Random | None = None) -> list[tuple[float, float]]:
         """
-        Generate a random point inside a bounding box.
+        Draw one random point inside each box, clamped to the visible page. \n
+        All points of a gesture are sampled together so the viewport is fetched once.
         
-        :param left: Leftmost x-value.
-        :type left: float
-        :param right: Rightmost x-value.
-        :type right: float
-        :param top: Highest y-value.
-        :type top: float
-        :param bottom: Lowest y-value.
-        :type bottom: float
-        :return: (x,y) values of the random point.
-        :rtype: tuple
+        :param viewport: {"width":width, "height":height} of the page.
+        :type viewport: dict[str, int]
+        :param boxes: (left, right, top, bottom) bounds to sample from.
+        :type boxes: list[tuple[float, float, float, float]]
+        :param rng: Random generator of the current gesture (defaults to the thread's generator).
+        :type rng: random.Random | None
+        :return: (x,y) values of the sampled points, in the order of boxes.
+        :rtype: list[tuple[float, float]]
         """
-        x = random.uniform(left, right)
-        y = random.uniform(top, bottom)
-        return x,y
+        rng = rng or _get_rng()
+        width = viewport["width"]
+        height = viewport["height"]
+        uniform = rng.uniform
+
+        return [
+            (
+                min(max(0, uniform(left, right)), width),
+                min(max(0, uniform(top, bottom)), height),
+            )
+            for left, right, top, bottom in boxes
+        ]
     
     
     @staticmethod
-    def _get_location(element: object, name: str = "") -> dict:
+    def _get_location(element: Locator | ElementHandle, name: str = "") -> dict:
         """
-        Get the location information of a Playwright locator object.
+        Get the location information of a Playwright Locator or ElementHandle. \n
+        A Locator re-queries the page on every call; pass an ElementHandle
+        resolved once to skip that when the same element is used repeatedly.
         
-        :param element: Playwright Locator object of the target element.
-        :type element: object
+        :param element: Playwright Locator or ElementHandle of the target element.
+        :type element: Locator | ElementHandle
         :param name: Optional name of the object (for readable Logger.logging).
         :type name: str
         :return: Python dictionary of location information
@@ -599,11 +1451,36 @@ class MouseManager:
             "y": y\n
             }
         """
-        if not name:
-            name = element
-
         element.scroll_into_view_if_needed()  
-        box = element.bounding_box()          
+        return MouseManager._box_to_location(element.bounding_box(), name or element)
+
+    @staticmethod
+    async def _a_get_location(element: AsyncLocator | AsyncElementHandle, name: str = "") -> dict:
+        """
+        Async variant of `_get_location`.
+        
+        :param element: Async Playwright Locator or ElementHandle of the target element.
+        :type element: AsyncLocator | AsyncElementHandle
+        :param name: Optional name of the object (for readable Logger.logging).
+        :type name: str
+        :return: Python dictionary of location information (see `_get_location`).
+        :rtype: dict
+        """
+        await element.scroll_into_view_if_needed()
+        return MouseManager._box_to_location(await element.bounding_box(), name or element)
+
+    @staticmethod
+    def _box_to_location(box: dict | None, name: object) -> dict:
+        """
+        Turn a Playwright bounding box into the location dictionary of `_get_location`.
+        
+        :param box: Bounding box ({"x", "y", "width", "height"}), or None when not visible.
+        :type box: dict | None
+        :param name: Name of the object (for readable Logger.logging).
+        :type name: object
+        :return: Python dictionary of location information
+        :rtype: dict
+        """
         if not box:
             raise Exception(f"{name} not visible")
         
@@ -627,13 +1504,19 @@ class MouseManager:
     @staticmethod
     def _get_viewport_size(page: Page) -> dict[str,int]:
         """
-        Get viewport size when not using built in browser.
+        Get viewport size when not using built in browser. \n
+        The result is cached per page until the next gesture starts, so the
+        JS fallback costs at most one round-trip per gesture.
         
         :param page: Playwright Page object
         :type page: Page
         :return: {"width":width, "height":height} dictionary.
         :rtype: dict[str, int]
         """
+        size = MouseManager._viewport_cache.get(page)
+        if size is not None:
+            return size
+
         size = page.viewport_size
         if size is None:
             # Fallback to querying via JS
@@ -643,179 +1526,330 @@ class MouseManager:
                     height: window.innerHeight
                 })
             """)
+        MouseManager._viewport_cache[page] = size
+        return size
+
+    @staticmethod
+    async def _a_get_viewport_size(page: AsyncPage) -> dict[str,int]:
+        """
+        Async variant of `_get_viewport_size`; shares its cache.
+        
+        :param page: Async Playwright Page object
+        :type page: AsyncPage
+        :return: {"width":width, "height":height} dictionary.
+        :rtype: dict[str, int]
+        """
+        size = MouseManager._viewport_cache.get(page)
+        if size is not None:
+            return size
+
+        size = page.viewport_size
+        if size is None:
+            # Fallback to querying via JS
+            size = await page.evaluate("""
+                () => ({
+                    width: window.innerWidth,
+                    height: window.innerHeight
+                })
+            """)
+        MouseManager._viewport_cache[page] = size
         return size
     
     @staticmethod
-    def human_movement(page: Page, element: object, click: bool = False) -> None:
+    def human_movement(page: Page, element: Locator | ElementHandle, click: bool = False) -> None:
         """
         Move the cursor to an element (doesn't click).
         
         :param page: Playwright Page object (your current page).
         :type page: Page
-        :param element: Playwright locator object of target element.
-        :type element: object
+        :param element: Playwright Locator or ElementHandle of target element.
+        :type element: Locator | ElementHandle
         :param click: This is meant to be an internal variable. You should use safe_click to click objects.
         :type click: bool
         """
+        # The window may have been resized since the last gesture.
+        MouseManager._viewport_cache.pop(page, None)
+
         coords = MouseManager._get_location(element)
+        rng = _get_rng()
+        waypoints = MouseManager._plan_gesture(coords, MouseManager._get_viewport_size(page), rng)
+
+        #move mouse to the initial location, then through every stage
+        for current_x, current_y in waypoints:
+            MouseManager._move_mouse_curved(page, current_x, current_y, rng=rng)
+        if click:
+            _human_delay(config.MIN_CLICK_DELAY, config.MAX_CLICK_DELAY)
+            final_x, final_y = current_x, current_y
+            page.mouse.click(final_x,final_y)
+
+        MouseManager._flush_mouse_location()
+
+    @staticmethod
+    async def a_human_movement(page: AsyncPage, element: AsyncLocator | AsyncElementHandle, click: bool = False) -> None:
+        """
+        Async variant of `human_movement`.
+        
+        :param page: Async Playwright Page object (your current page).
+        :type page: AsyncPage
+        :param element: Async Playwright Locator or ElementHandle of target element.
+        :type element: AsyncLocator | AsyncElementHandle
+        :param click: This is meant to be an internal variable. You should use a_safe_click to click objects.
+        :type click: bool
+        """
+        # The window may have been resized since the last gesture.
+        MouseManager._viewport_cache.pop(page, None)
+
+        coords = await MouseManager._a_get_location(element)
+        rng = _get_rng()
+        waypoints = MouseManager._plan_gesture(coords, await MouseManager._a_get_viewport_size(page), rng)
+
+        #move mouse to the initial location, then through every stage
+        for current_x, current_y in waypoints:
+            await MouseManager._a_move_mouse_curved(page, current_x, current_y, rng=rng)
+        if click:
+            await _a_human_delay(config.MIN_CLICK_DELAY, config.MAX_CLICK_DELAY)
+            final_x, final_y = current_x, current_y
+            await MouseManager._a_click_at(page, final_x, final_y)
+
+        MouseManager._flush_mouse_location()
+
+    @staticmethod
+    def _plan_gesture(coords: dict, viewport: dict[str, int], rng: random.Random) -> list[tuple[float, float]]:
+        """
+        Plan the stops of a gesture towards an element. \n
+        The first stop is a random point around the element, the next ones
+        overshoot and settle on a random target inside the element.
+        
+        :param coords: Location information of the element (see `_get_location`).
+        :type coords: dict
+        :param viewport: {"width":width, "height":height} of the page.
+        :type viewport: dict[str, int]
+        :param rng: Random generator of the current gesture.
+        :type rng: random.Random
+        :return: (x,y) values of every stop; the last one is the target.
+        :rtype: list[tuple[float, float]]
+        """
         left = coords["left"]
         top = coords["top"]
         right = coords["right"]
         bottom = coords["bottom"]
-        x = coords["x"]
-        y = coords["y"]
 
         #==========#
-        x_actual = x
-        y_actual = y
+        x_actual = coords["x"]
+        y_actual = coords["y"]
         overshoot_options = ["x","y"]
         #==========#
 
         #Calulate amount of stages
-        stages = random.randint(2,3)
-
-        #Caluclate target location
-        target_x, target_y = MouseManager._random_point_in_box(left,right,top,bottom)
-
-        #Initial random 
-        current_x,current_y = MouseManager._safe_cord_randomize(page, x_actual, y_actual)
-        
-        #move mouse to initial location
-        MouseManager._move_mouse_curved(page, current_x, current_y, steps=STEPS)
+        stages = rng.randint(2,3)
+
+        #Caluclate target location inside the element and the initial random point around it
+        (target_x, target_y), (current_x, current_y) = MouseManager._sample_points(
+            viewport,
+            [
+                (left, right, top, bottom),
+                (x_actual - 50, x_actual + 50, y_actual - 50, y_actual + 50),
+            ],
+            rng=rng,
+        )
+        waypoints = [(current_x, current_y)]
         
         #Calculate if current_x is farther from x_actual or current_y is farther from y_actual
         delta_x = abs(current_x - x_actual)
         delta_y = abs(current_y - y_actual)
-        #Handle all 3 cases
-        if delta_x > delta_y: 
-            overshoot = "x"
-            max_offset_y = MAX_NON_OVERSHOOT_OFFSET
-            max_offset_x = MAX_NON_OVERSHOOT_OFFSET
-
-        elif delta_y > delta_x: 
-            overshoot = "y"
-            max_offset_x = MAX_NON_OVERSHOOT_OFFSET
-            max_offset_y = MAX_OVERSHOOT_OFFSET
-
-        elif delta_y == delta_x:
-            overshoot = random.choice(overshoot_options)
-            if overshoot == "x":
-                max_offset_y = MAX_NON_OVERSHOOT_OFFSET
-                max_offset_x = MAX_OVERSHOOT_OFFSET
 
-            elif overshoot == "y":
-                max_offset_x = MAX_NON_OVERSHOOT_OFFSET
-                max_offset_y = MAX_OVERSHOOT_OFFSET
+        #Overshoot along the axis that strayed furthest (coin flip on a tie)
+        if delta_x == delta_y:
+            overshoot = rng.choice(overshoot_options)
+        else:
+            overshoot = "x" if delta_x > delta_y else "y"
 
+        if overshoot == "x":
+            max_offset_x, max_offset_y = config.MAX_OVERSHOOT_OFFSET, config.MAX_NON_OVERSHOOT_OFFSET
+        else:
+            max_offset_x, max_offset_y = config.MAX_NON_OVERSHOOT_OFFSET, config.MAX_OVERSHOOT_OFFSET
 
-        mouse_x, mouse_y = current_x, current_y
         #Begin to iterate 
         for i in range(stages):
-            factor = (stages - i) / stages
-            offset_x = random.uniform(-max_offset_x, max_offset_x) * factor
-            offset_y = random.uniform(-max_offset_y, max_offset_y) * factor
-            
             if i == stages - 1: 
-                current_x = target_x
-                current_y = target_y
+                waypoints.append((target_x, target_y))
             else:
-                current_x = target_x + offset_x
-                current_y = target_y + offset_y
+                factor = (stages - i) / stages
+                waypoints.append((
+                    target_x + (rng.random() * 2 - 1) * max_offset_x * factor,
+                    target_y + (rng.random() * 2 - 1) * max_offset_y * factor,
+                ))
 
-            MouseManager._move_mouse_curved(page, current_x, current_y)
-        if click:
-            DelayManager.human_delay(MIN_CLICK_DELAY, MAX_CLICK_DELAY)
-            final_x, final_y = current_x, current_y
-            page.mouse.click(final_x,final_y)
+        return waypoints
 
     @staticmethod
-    def safe_click(page:Page, element: object) -> None:
+    def safe_click(page:Page, element: Locator | ElementHandle) -> None:
         """
         Realstic clicking on an object.
         
         :param page: Playwright Page object (your current page).
         :type page: Page
-        :param element: Playwright locator object for the target element.
-        :type element: object
+        :param element: Playwright Locator or ElementHandle for the target element.
+        :type element: Locator | ElementHandle
         """
         MouseManager.human_movement(page, element, click=True)
 
+    @staticmethod
+    async def a_safe_click(page: AsyncPage, element: AsyncLocator | AsyncElementHandle) -> None:
+        """
+        Async variant of `safe_click`.
+        
+        :param page: Async Playwright Page object (your current page).
+        :type page: AsyncPage
+        :param element: Async Playwright Locator or ElementHandle for the target element.
+        :type element: AsyncLocator | AsyncElementHandle
+        """
+        await MouseManager.a_human_movement(page, element, click=True)
+
+atexit.register(MouseManager._flush_mouse_location)
+
 class TypingManager:
     """
     Handles human-like typign behavior
     """
     
+    @staticmethod
     def human_typing (
         page: Page,
-        element: object ,          
+        element: Locator | ElementHandle,          
         text: str,
         typo_chance: float = 0.1,
         min_delay: float = 0.05,
         max_delay: float = 0.2,
+        submit: bool = False,
     ) -> None:
         """
         Types like a human with realstic typos. Custom keyboard can be configured in config.json.
         
         :param page: Playwright Page object (your current page).
         :type page: Page
-        :param element: Playwright locator object for target element.
-        :type element: object
+        :param element: Playwright Locator or ElementHandle for target element.
+        :type element: Locator | ElementHandle
         :param text: Text to type
         :type text: str
         :param typo_chance: Chance of a typo (default = 0.1)
         :type typo_chance: float
-        :param min_delay: Minimum delay between keypresses (default = 0.05). Converted to MS in script.
+        :param min_delay: Minimum delay between keypresses in seconds (default = 0.05).
         :type min_delay: float
-        :param max_delay: Minimum delay between keypresses (default = 0.2). Converted to MS in script.
+        :param max_delay: Maximum delay between keypresses in seconds (default = 0.2).
         :type max_delay: float
+        :param submit: Press Enter after the last key, at the same pace (default = False).
+        :type submit: bool
         """
         element.focus()
+        keyboard = page.keyboard
+        # Not time.sleep: sync Playwright only dispatches events (routes,
+        # dialogs, page.on handlers) while one of its calls is running.
+        wait = page.wait_for_timeout
 
-        i = 0
-        while i < len(text):
-            chunk_size = random.randint(3, 5)
-            chunk = text[i : i + chunk_size]
+        for chunk, typed_chunk in TypingManager._typing_chunks(text, typo_chance):
+            # --- type chunk in one call, Playwright paces the keys itself ---
+            keyboard.type(typed_chunk, delay=random.uniform(min_delay, max_delay) * 1000)
+            wait(random.uniform(min_delay, max_delay) * 1000)
 
-            typed_chunk = ""
+            # --- correct if typo occurred ---
+            if typed_chunk != chunk:
+                # short "realization pause"
+                wait(random.uniform(0.15, 0.35) * 1000)
 
-            # --- type chunk (with possible typos) ---
-            for char in chunk:
-                if (
-                    char.lower() in KEYBOARD_ADJACENCY
-                    and random.random() < typo_chance
-                ):
-                    char_to_type = random.choice(KEYBOARD_ADJACENCY[char.lower()])
-                else:
-                    char_to_type = char
+                # backspace at human speed
+                for _ in typed_chunk:
+                    keyboard.press("Backspace")
+                    wait(random.uniform(min_delay, max_delay) * 1000)
 
-                element.type(char_to_type)
-                typed_chunk += char_to_type
+                # re-type chunk at NORMAL speed
+                keyboard.type(chunk, delay=random.uniform(min_delay, max_delay) * 1000)
+                wait(random.uniform(min_delay, max_delay) * 1000)
+
+        if submit:
+            keyboard.press("Enter")
+
+    @staticmethod
+    async def a_human_typing (
+        page: AsyncPage,
+        element: AsyncLocator | AsyncElementHandle,          
+        text: str,
+        typo_chance: float = 0.1,
+        min_delay: float = 0.05,
+        max_delay: float = 0.2,
+        submit: bool = False,
+    ) -> None:
+        """
+        Async variant of `human_typing`.
+        
+        :param page: Async Playwright Page object (your current page).
+        :type page: AsyncPage
+        :param element: Async Playwright Locator or ElementHandle for target element.
+        :type element: AsyncLocator | AsyncElementHandle
+        :param text: Text to type
+        :type text: str
+        :param typo_chance: Chance of a typo (default = 0.1)
+        :type typo_chance: float
+        :param min_delay: Minimum delay between keypresses in seconds (default = 0.05).
+        :type min_delay: float
+        :param max_delay: Maximum delay between keypresses in seconds (default = 0.2).
+        :type max_delay: float
+        :param submit: Press Enter after the last key, at the same pace (default = False).
+        :type submit: bool
+        """
+        await element.focus()
+        keyboard = page.keyboard
 
-                page.wait_for_timeout(
-                    random.uniform(min_delay, max_delay) * 1000
-                )
+        for chunk, typed_chunk in TypingManager._typing_chunks(text, typo_chance):
+            # --- type chunk in one call, Playwright paces the keys itself ---
+            await keyboard.type(typed_chunk, delay=random.uniform(min_delay, max_delay) * 1000)
+            await asyncio.sleep(random.uniform(min_delay, max_delay))
 
             # --- correct if typo occurred ---
             if typed_chunk != chunk:
                 # short "realization pause"
-                page.wait_for_timeout(
-                    random.uniform(0.15, 0.35) * 1000
-                )
+                await asyncio.sleep(random.uniform(0.15, 0.35))
 
                 # backspace at human speed
                 for _ in typed_chunk:
-                    element.press("Backspace")
-                    page.wait_for_timeout(
-                        random.uniform(min_delay, max_delay) * 1000
-                    )
+                    await keyboard.press("Backspace")
+                    await asyncio.sleep(random.uniform(min_delay, max_delay))
 
                 # re-type chunk at NORMAL speed
-                for char in chunk:
-                    element.type(char)
-                    page.wait_for_timeout(
-                        random.uniform(min_delay, max_delay) * 1000
-                    )
+                await keyboard.type(chunk, delay=random.uniform(min_delay, max_delay) * 1000)
+                await asyncio.sleep(random.uniform(min_delay, max_delay))
+
+        if submit:
+            await keyboard.press("Enter")
 
+    @staticmethod
+    def _typing_chunks(text: str, typo_chance: float):
+        """
+        Split text into chunks of 3-5 characters and pick the keys actually hit for each.
+        
+        :param text: Text to type
+        :type text: str
+        :param typo_chance: Chance of a typo per character.
+        :type typo_chance: float
+        :return: Generator of (chunk, typed chunk) pairs; they differ when a typo occurred.
+        """
+        adjacency = config.KEYBOARD_ADJACENCY
+
+        i = 0
+        while i < len(text):
+            chunk_size = random.randint(3, 5)
+            chunk = text[i : i + chunk_size]
+
+            # --- pick the keys for this chunk (with possible typos) ---
+            typed_chunk = ""
+            for char in chunk:
+                neighbours = adjacency.get(char.lower())
+                if neighbours and random.random() < typo_chance:
+                    typed_chunk += random.choice(neighbours)
+                else:
+                    typed_chunk += char
+
+            yield chunk, typed_chunk
             i += chunk_size
 
 class ScrollManager:
@@ -832,6 +1866,23 @@ class ScrollManager:
         :param total_pixels: Total pixels to scroll.
         :type total_pixels: int
         """
+        # Not time.sleep, so Playwright keeps dispatching events during pauses.
+        wait = page.wait_for_timeout
+        for step, delay in ScrollManager._scroll_schedule(total_pixels):
+            page.mouse.wheel(0, step)
+            wait(delay * 1000)
+
+    @staticmethod
+    def _scroll_schedule(total_pixels: int) -> list[tuple[int, float]]:
+        """
+        Precompute the wheel steps of a scroll with decaying velocity.
+        
+        :param total_pixels: Total pixels to scroll.
+        :type total_pixels: int
+        :return: (wheel delta, pause in seconds) for each step.
+        :rtype: list[tuple[int, float]]
+        """
+        schedule = []
         remaining = total_pixels
         velocity = random.randint(80, 140)
 
@@ -843,16 +1894,50 @@ class ScrollManager:
                 step = remaining
 
             step += random.randint(-3, 3)
-
-            page.mouse.wheel(0, step)
             remaining -= abs(step)
 
             delay = max(0.01, min(0.12, 1 / (velocity + 1)))
-            page.wait_for_timeout(delay * 1000)
+            schedule.append((step, delay))
 
             if velocity < 8:
                 break
+
+        return schedule
     
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Repeated downloads reuse its pooled keep-alive connections (and their TLS
+    sessions) instead of reconnecting on every call. `requests` is only
+    imported here, so importing this module stays cheap.
+
+    :return: The shared session.
+    :rtype: requests.Session
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(total=2, backoff_factor=0.2),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
 class NetworkUtils:
     "Handles network operations"
     
@@ -863,14 +1948,49 @@ class NetworkUtils:
 
         :param url: Image URL.
         :param timeout: Timeout before failure (default=15)
-        :return: Tuple containing image bytes and image type (e.g., 'png', 'jpeg').
+        :return: Tuple containing image bytes and image type (e.g., 'png', 'jpg').
         """
-        r = requests.get(url, timeout=timeout)
+        r = _get_session().get(url, timeout=timeout)
         r.raise_for_status()
         image_bytes = r.content
 
-        kind = filetype.guess(image_bytes)
-        image_type = kind.extension if kind else "unknown"
-        print(image_type)
+        image_type = NetworkUtils._sniff_image_type(image_bytes)
+
+        return image_bytes, image_type
+
+    @staticmethod
+    def _sniff_image_type(data: bytes) -> str:
+        """
+        Identify common image formats from their magic bytes.
+
+        :param data: Image bytes (only the first 12 bytes are inspected).
+        :return: 'png', 'jpg', 'gif', 'webp', or 'unknown'.
+        """
+        if data[:8] == b"\x89PNG\r\n\x1a\n":
+            return "png"
+        if data[:3] == b"\xff\xd8\xff":
+            return "jpg"
+        if data[:6] in (b"GIF87a", b"GIF89a"):
+            return "gif"
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            return "webp"
+        return "unknown"
+
+    @staticmethod
+    def url_to_bytes_many(urls: list[str], timeout: int = 15, max_workers: int = 10) -> list[tuple[bytes, str]]:
+        """
+        Fetch several images concurrently and return their bytes and types.
+
+        Downloads run on a thread pool sharing the pooled session, so wall time
+        is bounded by the slowest request rather than the sum of all of them.
+
+        :param urls: Image URLs.
+        :param timeout: Timeout before failure for each request (default=15)
+        :param max_workers: Maximum number of concurrent downloads (default=10)
+        :return: List of (image bytes, image type) tuples in the same order as urls.
+        """
+        if not urls:
+            return []
 
-        return image_bytes, image_type
\ No newline at end of file
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+            return list(pool.map(lambda url: NetworkUtils.url_to_bytes(url, timeout), urls))
@@ -1,14 +1,10 @@
-# Import wanted classes from human_utils
-from core.human_utils import Logger, BrowserManager, MouseManager, DelayManager, TypingManager
-
-# Assign browser instance. Make sure to run ./open.ps1 to start chrome.
-browser = BrowserManager("http://localhost:9222")
+import asyncio
+import os
 
-# Connect to the browser
-context = browser.connect()
+from playwright.async_api import async_playwright
 
-# Create page instance. This is the website you want to use.
-page = browser.create_page("https://example.com")
+# Import wanted classes from human_utils
+from core.human_utils import Logger, BrowserManager, MouseManager, DelayManager, TypingManager
 
 # Assign additional instances 
 logger = Logger()
@@ -16,41 +12,125 @@ mouse = MouseManager()
 delay = DelayManager()
 safe_keyboard = TypingManager()
 
-# Enable mouse tracking to visualize movement 
-mouse.enable_cursor_tracking(page)
+# Pages opened by this script. Only these get closed: the rest of the context is the user's browser.
+opened_pages = []
+
+
+async def new_page(context):
+    page = await context.new_page()
+    opened_pages.append(page)
+    return page
+
+
+async def visit_example(context):
+    # Create page instance. This is the website you want to use.
+    page = await new_page(context)
+    # No need to wait for every subresource, locators wait for their element anyway.
+    await page.goto("https://example.com", wait_until="domcontentloaded")
+
+    # Create a Playwright locator object of the heading 
+    heading = page.get_by_role("heading", name="Example Domain")
+
+    # Resolve it once; every idle movement reuses the handle instead of re-querying the page.
+    heading_handle = await heading.element_handle(timeout=5000)
+
+    # Look up the link in the background while the cursor idles on the heading.
+    learn_more_task = asyncio.create_task(page.get_by_role("link", name="Learn more").element_handle())
+    google_page_task = None
+
+    try:
+        # Simulate reading/interest in the section by moving the cursor to that area and idling.
+        await delay.a_idle_delay(
+            page = page, 
+            element = heading_handle
+            )
+
+        # Let's now automate some navigation!
+
+        learn_more_button = await learn_more_task
+
+        await mouse.a_safe_click(page, learn_more_button)
+
+        logger.log("Clicked 'learn more", 1)
+
+        # Start opening google now so it loads during the pause. Not any earlier: the new
+        # tab comes to the front, and the gestures above must land on a visible page.
+        google_page_task = asyncio.create_task(open_google(context))
+
+        await delay.a_human_delay(2,5,"because, just beacause!")
+
+        return page, await google_page_task
+    finally:
+        # If we got here by an error, stop the background work before main() cleans up.
+        # Finished tasks are gathered too, so an error they hold is never reported as unretrieved.
+        tasks = [task for task in (learn_more_task, google_page_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
-# Create a Playwright locator object of the heading 
-heading = page.get_by_role("heading", name="Example Domain")
+async def open_google(context):
+    page = await new_page(context)
+    await page.goto("https://google.com", wait_until="commit")
 
-# Simulate reading/interest in the section by moving the cursor to that area and idling.
-delay.idle_delay(
-    page = page, 
-    element = heading
-    )
+    # Find the search box while still in the background, so it's ready when we switch over.
+    search_text_box = await page.get_by_role("combobox", name="Search").element_handle()
+    return page, search_text_box
 
-# Let's now automate some navigation!
 
-learn_more_button = page.get_by_role("link", name="Learn more")
+async def visit_google(page, search_text_box):
+    await mouse.a_safe_click(page, search_text_box)
 
-mouse.safe_click(page, learn_more_button)
+    await safe_keyboard.a_human_typing(page, search_text_box, "github", submit=True)
 
-logger.log("Clicked 'learn more", 1)
+    return page
 
-delay.human_delay(2,5,"because, just beacause!")
 
-page = browser.create_page("https://google.com")
+async def main():
+    async with async_playwright() as pw:
+        # Connect to the browser. Make sure to run ./open.ps1 to start chrome.
+        browser = await pw.chromium.connect_over_cdp("http://localhost:9222")
+        context = browser.contexts[0]
 
-mouse.enable_cursor_tracking(page)
+        # Optionally draw the red cursor on every page of the context (CURSOR_TRACKING=1).
+        # Off by default: the init script can't be removed again, so it stays in your
+        # real browser profile, on every tab, until the browser restarts.
+        if os.environ.get("CURSOR_TRACKING") == "1":
+            await mouse.a_enable_context_cursor_tracking(context)
 
-search_text_box = page.get_by_role("combobox", name="Search")
+        # Optionally skip images, fonts, media and analytics (BLOCK_RESOURCES=1). Off by
+        # default: this is your real browser, and every tab in it would be affected.
+        block_resources = os.environ.get("BLOCK_RESOURCES") == "1"
+        if block_resources:
+            await BrowserManager.a_block_heavy_resources(context)
 
-mouse.safe_click(page, search_text_box)
+        try:
+            # Google is opened in the background while the example visit pauses. The
+            # visits themselves run one after the other: there's a single cursor, and
+            # two gestures at once would each start their curves wherever the other
+            # one last left it.
+            example_page, (google_page, search_text_box) = await visit_example(context)
+            await visit_google(google_page, search_text_box)
 
-safe_keyboard.human_typing(page, search_text_box, "github")
+            logger.log("We're back!",1)
 
-page.keyboard.press("Enter")
+            # Open the Playwright Inspector only when asked to (PW_INSPECT=1), so normal runs exit.
+            if os.environ.get("PW_INSPECT") == "1":
+                await google_page.pause()
+        finally:
+            # Close the pages we opened, even if a step failed.
+            # A failing close must not stop the others or hide the original error.
+            for page in opened_pages:
+                try:
+                    await page.close(run_before_unload=False)
+                except Exception as e:
+                    logger.log(f"Couldn't close {page.url}: {e}", 2)
 
-logger.log("We're back!",1)
+            if block_resources:
+                try:
+                    await BrowserManager.a_unblock_heavy_resources(context)
+                except Exception as e:
+                    logger.log(f"Couldn't remove resource blocking: {e}", 2)
 
 
-page.pause()
+asyncio.run(main())